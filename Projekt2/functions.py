@@ -1,119 +1,249 @@
 import numpy as np
 import math
-import cmath
+import functools
+import collections
+from numba import njit, prange
+
+#pyFFTW is optional, scipy.fft has the same interface and is used when it's missing
+try:
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft as fft_backend
+    pyfftw.interfaces.cache.enable()
+    #plans survive a minute between replots instead of the default 0.1s
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+except ImportError:
+    pyfftw = None
+    import scipy.fft as fft_backend
 
-# from networkx import dfs_edges
 from scipy.io import wavfile
+import scipy.fft
+import scipy.signal
 import matplotlib.pyplot as plt
 import seaborn as sns
 import random
 
-from torch.onnx.symbolic_opset9 import baddbmm
 
-
-#pamiętaj chemiku młody zawsze wlewaj listę dlugosci 2^n do tej funkcji
 def FFT(list):
-    n = len(list)
-    if n == 1:
-        #stała jest wartością wielomianu stopnia 0 w w_0
-        return list
-    w = cmath.exp(2*math.pi*1j/n)
-    e_val = FFT(list[::2])
-    o_val = FFT(list[1::2])
-    ret = [0] * n
-    for i in range(n//2):
-        ret[i] = e_val[i] + (w**i * o_val[i])
-        ret[i+n//2] = e_val[i] - (w **i* o_val[i])
-    return np.array(ret)
+    return np.fft.fft(np.asarray(list))
 
 def meaningful_FFT(signal):
-    fefete = FFT(signal)[::2]
-    return np.abs(fefete)
+    return np.abs(np.fft.rfft(signal))
 
 
+#smallest power of two that is at least min_frame_dur long
 def frame_length(sr, min_frame_dur):
-    T = 1 / sr
-    l = 1
-    while (T * l < min_frame_dur):
-        l*=2
-    return l
+    return 1 << max(0, math.ceil(math.log2(sr * min_frame_dur)))
 
 def dtft(frames, sr):
     N = len(frames[0])
-    fft = np.fft.rfft(frames, n=N, axis=1)
-    freqs = np.fft.rfftfreq(N, 1 / sr)
+    fft = fft_backend.rfft(frames, n=N, axis=1, workers=-1)
+    freqs = _rfftfreq(N, sr)
     return fft, freqs
 
+#same (N, sr) comes back on every replot, read-only because the array is shared
+@functools.lru_cache(maxsize=16)
+def _rfftfreq(N, sr):
+    freqs = np.fft.rfftfreq(N, 1 / sr)
+    freqs.setflags(write=False)
+    return freqs
+
+#numba's default threading layer deadlocks at exit once parallel kernels were launched from more than one thread,
+#so the parallel ones below are only ever called from the GUI thread and anything used on a worker stays serial
+
+#abs and max fused into one pass, np.max(np.abs(x)) allocates a temporary the size of the signal.
+#Runs while loading a file on a worker, so serial
+@njit(cache=True, fastmath=True)
+def max_abs(x):
+    m = 0.0
+    for i in range(x.shape[0]):
+        m = max(m, abs(x[i]))
+    return m
+
+#integer PCM to normalized float32 in one pass, no intermediate astype copy. Runs on the load worker too
+@njit(cache=True, fastmath=True)
+def _scale_to_float32(x, scale, out):
+    for i in range(x.shape[0]):
+        out[i] = x[i] * scale
+
+def pcm_to_float32(x):
+    out = np.empty(x.shape[0], dtype=np.float32)
+    _scale_to_float32(x, np.float32(1.0 / np.iinfo(x.dtype).max), out)
+    return out
+
+#min and max of every bucket interleaved, bucket edges spread the remainder so no tail samples are lost
+@njit(cache=True, parallel=True)
+def _minmax_buckets(x, n_buckets):
+    n = x.shape[0]
+    out = np.empty(2 * n_buckets, dtype=x.dtype)
+    for i in prange(n_buckets):
+        start = i * n // n_buckets
+        end = (i + 1) * n // n_buckets
+        lo = x[start]
+        hi = lo
+        for j in range(start + 1, end):
+            v = x[j]
+            if v < lo:
+                lo = v
+            elif v > hi:
+                hi = v
+        out[2 * i] = lo
+        out[2 * i + 1] = hi
+    return out
+
+#a canvas can't show more than ~2 points per pixel column, so long signals are drawn as their min/max envelope,
+#which keeps every peak visible with a fraction of the vertices. Short signals are returned as they are,
+#with time (their precomputed sample times) when given instead of a new arange
+def minmax_envelope(signal, sr, n_buckets, time=None):
+    n = len(signal)
+    if n < 4 * n_buckets:
+        return (np.arange(n) / sr if time is None else time), signal
+    envelope = _minmax_buckets(signal, n_buckets)
+    time = np.repeat(np.arange(n_buckets) * n // n_buckets, 2) / sr
+    return time, envelope
+
+#anything quieter than this relative to the peak is clamped to it, -80dB is the floor of the plot anyway.
+#The kernel works on power, so the floor is squared too
+_POWER_FLOOR = 1e-8
+
+#power and its peak in one pass (kept in out), then dB relative to the peak in a second one,
+#instead of abs, max, divide and log10 each walking the spectrum. 10*log10 of the power is the same
+#as 20*log10 of the magnitude without a sqrt per bin. False when the spectrum is all zeros
+@njit(cache=True, parallel=True, fastmath=True)
+def _mag_db(fft, out):
+    m = 0.0
+    for i in prange(fft.shape[0]):
+        p = fft[i].real * fft[i].real + fft[i].imag * fft[i].imag
+        out[i] = p
+        m = max(m, p)
+    if m == 0.0:
+        return False
+    scale = 1.0 / m
+    for i in prange(out.shape[0]):
+        out[i] = 10 * math.log10(max(out[i] * scale, _POWER_FLOOR))
+    return True
+
+#one-sided spectrum of a whole (windowed) signal in dB relative to its peak, goes through the same backend as dtft,
+#dB is None for a silent signal. Zero padded to the next FFT-friendly length so odd sized selections don't end up
+#in Bluestein, the padding only samples the same spectrum more densely. signal may be used as scratch space
+def spectrum_db(signal, sr):
+    N = scipy.fft.next_fast_len(len(signal), real=True)
+    fft = fft_backend.rfft(signal, n=N, workers=-1, overwrite_x=True)
+    magnitude_db = np.empty(fft.shape[0], dtype=fft.real.dtype)
+    if not _mag_db(fft, magnitude_db):
+        magnitude_db = None
+    return magnitude_db, _rfftfreq(N, sr)
+
 def frame_signal(signal, frame_length, overlap):
-    hop_length = int(frame_length * (1-overlap))
+    hop_length = max(1, int(frame_length * (1-overlap)))
     overhang = (len(signal) - frame_length) % hop_length
     pad_length = hop_length - overhang if overhang!=0 else 0
-    padded_signal = np.pad(signal, (0, pad_length), 'constant')
+    if pad_length == 0:
+        padded_signal = signal
+    else:
+        padded_signal = np.zeros(len(signal) + pad_length, dtype=signal.dtype)
+        padded_signal[:len(signal)] = signal
 
     frames = np.lib.stride_tricks.sliding_window_view(padded_signal, window_shape=frame_length)[::hop_length]
     return frames
 
-def window_signal(signal, window_type):
-    if window_type == 'rectangular':
-        return signal
-    N = len(signal)
-    if window_type == 'triangular':
-        window = np.bartlett(N)
-    elif window_type == 'hamming':
-        window = np.hamming(N)
-    elif window_type == 'hanning':
-        window = np.hanning(N)
-    elif window_type == 'blackman':
-        window = np.blackman(N)
-    else:
+_WINDOW_FUNCS = {
+    'rectangular': np.ones,
+    'triangular': np.bartlett,
+    'hamming': np.hamming,
+    'hanning': np.hanning,
+    'blackman': np.blackman,
+}
+
+#float32 coefficients, the frames they multiply are float32 too and the window tab reuses them on every selection
+@functools.lru_cache(maxsize=32)
+def get_window(window_type, N):
+    window_func = _WINDOW_FUNCS.get(window_type)
+    if window_func is None:
         raise ValueError('Unknown window type')
-    return window * signal
-
+    window = np.ascontiguousarray(window_func(N), dtype=np.float32)
+    #shared between calls, so nobody gets to modify it in place
+    window.setflags(write=False)
+    return window
 
+#works on a single frame as well as on a whole (M, N) matrix of frames,
+#frames from frame_signal are a strided view so either way the result is one contiguous copy for the FFT
+def window_signal(signal, window_type):
+    if window_type == 'rectangular':
+        if signal.flags['C_CONTIGUOUS']:
+            return signal
+        out = _empty_aligned(signal.shape, signal.dtype)
+        np.copyto(out, signal)
+        return out
+    window = get_window(window_type, signal.shape[-1])
+    out = _empty_aligned(signal.shape, np.promote_types(signal.dtype, np.float32))
+    return np.multiply(signal, window, out=out)
+
+#SIMD aligned buffer when pyFFTW is around, so its planner can pick the fast kernels
+def _empty_aligned(shape, dtype):
+    if pyfftw is None:
+        return np.empty(shape, dtype=dtype)
+    return pyfftw.empty_aligned(shape, dtype=dtype)
+
+
+
+#headroom above max_freq left for the anti-aliasing filter when decimating
+_DECIMATION_MARGIN = 1.25
+
+#compute and draw are kept apart so the STFT can run off the GUI thread, only drawing needs the figure
+def compute_spectrogram(sr, signal, overlap=0.5, min_frame_dur = 0.2, window = 'rectangular', max_freq=2000):
+    #everything above max_freq gets thrown away anyway, so when the signal is heavily oversampled for it
+    #it's decimated first - frames get shorter and so does every FFT
+    #down is kept a power of two so frame_length (rounded to a power of two) shrinks by exactly down,
+    #otherwise the frames would last longer than on the undecimated path
+    down = int(sr // (2 * max_freq * _DECIMATION_MARGIN))
+    if down >= 2:
+        down = 1 << (down.bit_length() - 1)
+        signal = scipy.signal.resample_poly(signal, up=1, down=down)
+        sr = sr / down
 
-def plot_spectrogram(fig, sr, signal, overlap=0.5, min_frame_dur = 0.2, window = 'rectangular', max_freq=2000):
     #first determine frame_length
     l = frame_length(sr, min_frame_dur)
     frames = frame_signal(signal, l, overlap)
 
-    fig.clear()
-
-    windowed_frames = np.array([window_signal(frame, window) for frame in frames])
+    windowed_frames = window_signal(frames, window)
 
     spec, freqs = dtft(windowed_frames, sr)
-    magnitude = np.abs(spec)
 
     num_freq_bins = spec.shape[1]
     max_bin = int(max_freq / (sr / 2) * (num_freq_bins - 1))
 
-    spec_db = 20 * np.log10(magnitude[:, :max_bin + 1] + 1e-10)
-    spec_db = np.flipud(spec_db.T)
-
-
-
-    num_frames = spec_db.shape[1]
-    num_freqs = spec_db.shape[0]
-
-
-    total_duration = len(signal) / sr
-    # times = np.arange(len(signal))  / sr
-
-    ax = fig.add_subplot(111)
-
-    # plt.figure(figsize=(10, 10))
-    sns.heatmap(spec_db, xticklabels=100, yticklabels=20, cmap='mako', cbar_kws={'label': 'dB'}, ax=ax)
-
-    ax.set_xlabel("Time (s)")
-    ax.set_ylabel("Frequency (Hz)")
+    #slice before anything else and do the dB conversion in place, so only one real buffer is allocated
+    spec_db = np.abs(spec[:, :max_bin + 1])
+    spec_db += 1e-10
+    np.log10(spec_db, out=spec_db)
+    spec_db *= 20
+    #imshow with origin='lower' puts 0Hz at the bottom, no flipping needed
+    return spec_db.T
+
+#pass the image returned by an earlier call to update it in place, instead of rebuilding the axes and colorbar
+def draw_spectrogram(fig, spec_db, total_duration, overlap=0.5, min_frame_dur = 0.2, window = 'rectangular', max_freq=2000, im=None):
+    extent = [0, total_duration, 0, max_freq]
+    if im is None:
+        fig.clear()
+
+        ax = fig.add_subplot(111)
+
+        # plt.figure(figsize=(10, 10))
+        im = ax.imshow(spec_db, aspect='auto', origin='lower', cmap='mako', interpolation='nearest',
+                       extent=extent)
+        fig.colorbar(im, ax=ax, label='dB')
+
+        ax.set_xlabel("Time (s)")
+        ax.set_ylabel("Frequency (Hz)")
+    else:
+        ax = im.axes
+        im.set_data(spec_db)
+        im.set_clim(spec_db.min(), spec_db.max())
+        im.set_extent(extent)
+        ax.set_xlim(0, total_duration)
+        ax.set_ylim(0, max_freq)
     ax.set_title(f"Spectrogram (Window: {window}, Frame: {min_frame_dur * 1000:.0f}ms, Overlap: {overlap:.2f})")
-
-    # Set custom tick labels
-    ax.set_xticks(np.linspace(0, num_frames, 10))
-    ax.set_xticklabels([f"{t:.2f}s" for t in np.linspace(0, total_duration, 10)])
-    ax.set_yticks(np.linspace(0, num_freqs, 5))
-    ax.set_yticklabels([f"{f:.0f}Hz" for f in np.linspace(max_freq, 0, 5)])
-
-    fig.tight_layout()
+    return im
     # plt.xlabel("Time frame")
     # plt.ylabel("Frequency bin (flipped)")
     # plt.title("Spectrogram (Seaborn Matrix View)")
@@ -122,29 +252,48 @@ def plot_spectrogram(fig, sr, signal, overlap=0.5, min_frame_dur = 0.2, window =
     # plt.tight_layout()
     # plt.show()
 
+def plot_spectrogram(fig, sr, signal, overlap=0.5, min_frame_dur = 0.2, window = 'rectangular', max_freq=2000):
+    spec_db = compute_spectrogram(sr, signal, overlap, min_frame_dur, window, max_freq)
+    draw_spectrogram(fig, spec_db, len(signal) / sr, overlap, min_frame_dur, window, max_freq)
+
 
 def f0_from_cepstrum(signal, sr):
     windowed_signal = np.hanning(len(signal))*signal
-    spectrum = np.fft.fft(windowed_signal)
+    spectrum = fft_backend.fft(windowed_signal)
     log_spectrum = np.log(np.abs(spectrum) + 10e-10)
-    cepstrum = np.fft.ifft(log_spectrum).real
+    cepstrum = fft_backend.ifft(log_spectrum).real
 
     min_quefrency = int(sr/500)
-    max_quefrency = int(sr/50)
+    #past half the length the cepstrum only mirrors the first half
+    max_quefrency = min(int(sr/50), len(signal)//2)
 
     cepstrum = cepstrum[min_quefrency:max_quefrency]
     peak_idx = np.argmax(cepstrum) + min_quefrency
     f0 = sr / peak_idx
     return f0
 
-def plot_f0_from_cepstrum(fig, signal, sr):
-    fig.clear()
+#same as f0_from_cepstrum, but for the whole (M, N) matrix of frames in one rfft + one irfft,
+#log spectrum of a real signal is real and symmetric so the real transforms are enough
+def _f0_batch(frames, sr, hann):
+    N = frames.shape[1]
+    min_quefrency = int(sr/500)
+    max_quefrency = min(int(sr/50), N//2)
+
+    spectrum = fft_backend.rfft(np.multiply(frames, hann, dtype=frames.dtype), axis=1, workers=-1)
+    log_spectrum = np.log(np.abs(spectrum) + 10e-10)
+    cepstrum = fft_backend.irfft(log_spectrum, n=N, axis=1, workers=-1)
+
+    peak_idx = np.argmax(cepstrum[:, min_quefrency:max_quefrency], axis=1) + min_quefrency
+    return sr / peak_idx
+
+def compute_f0_from_cepstrum(signal, sr):
     l = frame_length(sr, 0.02)
     frames = frame_signal(signal, l, 0.5)
-    windowed_frames = np.array([window_signal(frame, 'hamming') for frame in frames])
-    f0s = [f0_from_cepstrum(frame, sr) for frame in windowed_frames]
+    windowed_frames = window_signal(frames, 'hamming')
+    return _f0_batch(windowed_frames, sr, get_window('hanning', l))
 
-    total_duration = len(signal) / sr
+def draw_f0_from_cepstrum(fig, f0s, total_duration):
+    fig.clear()
     sns.set_theme(style="darkgrid")
 
     ax = fig.add_subplot(111)
@@ -157,16 +306,138 @@ def plot_f0_from_cepstrum(fig, signal, sr):
     ax.set_xticks(np.linspace(0, len(f0s), 10))
     ax.set_xticklabels([f"{t:.2f}s" for t in np.linspace(0, total_duration, 10)])
 
-    fig.tight_layout()
+def plot_f0_from_cepstrum(fig, signal, sr):
+    f0s = compute_f0_from_cepstrum(signal, sr)
+    draw_f0_from_cepstrum(fig, f0s, len(signal) / sr)
+
+#the acoustic feature plots all use the same hamming windowed STFT of the same signal,
+#so the last few magnitude spectrograms are kept around instead of being recomputed for every plot
+_stft_cache = collections.OrderedDict()
+_STFT_CACHE_SIZE = 4
+
+def compute_stft_cached(signal, sr, min_frame_dur, overlap, window='hamming'):
+    key = (id(signal), sr, min_frame_dur, overlap, window)
+    entry = _stft_cache.get(key)
+    #id() can be reused once the old signal is gone, so the cached entry keeps the signal and is checked against it
+    if entry is not None and entry[0] is signal:
+        _stft_cache.move_to_end(key)
+        return entry[1]
 
-def plot_volume(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
-    fig.clear()
     l = frame_length(sr, min_frame_dur)
     frames = frame_signal(signal, l, overlap)
-    windowed_frames = np.array([window_signal(frame, 'hamming') for frame in frames])
+    windowed_frames = window_signal(frames, window)
     spec, freqs = dtft(windowed_frames, sr)
     spec = np.abs(spec)
-    vols = [vol(frame) for frame in spec]
+    spec.setflags(write=False)
+
+    _stft_cache[key] = (signal, (spec, freqs, l))
+    if len(_stft_cache) > _STFT_CACHE_SIZE:
+        _stft_cache.popitem(last=False)
+    return spec, freqs, l
+
+#frequency bands used by BER, SFM and SCF: 0-630Hz, 630-1720Hz, 1720-4400Hz
+def _band_slices(sr, num_freq_bins):
+    f1, f2, f3 = 630, 1720, 4400
+    idx1 = int(f1 / (sr / 2) * (num_freq_bins - 1))
+    idx2 = int(f2 / (sr / 2) * (num_freq_bins - 1))
+    idx3 = int(f3 / (sr / 2) * (num_freq_bins - 1))
+    return slice(0, idx1), slice(idx1, idx2), slice(idx2, idx3)
+
+#all six acoustic features of one frame come out of the same few sums over its spectrum, so they're computed
+#together, one frame per thread, instead of every feature function walking the whole spectrogram on its own.
+#Columns of out: volume, centroid, bandwidth, ESRB 1-3, SFM 1-3, SCF 1-3
+_N_FEATURES = 12
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _frame_features(spec, freqs, edges, win_sum, out):
+    K = spec.shape[1]
+    for m in prange(spec.shape[0]):
+        x = spec[m]
+        s = 0.0
+        sf = 0.0
+        p = 0.0
+        for k in range(K):
+            s += x[k]
+            sf += freqs[k] * x[k]
+            p += x[k] * x[k]
+        fc = sf / s if s != 0.0 else 0.0
+        bw = 0.0
+        if p != 0.0:
+            for k in range(K):
+                d = freqs[k] - fc
+                bw += d * d * x[k] * x[k]
+            bw = math.sqrt(bw / p)
+        v = p / K
+        out[m, 0] = v
+        out[m, 1] = fc
+        out[m, 2] = bw
+        for b in range(3):
+            lo = edges[b]
+            hi = edges[b + 1]
+            bp = 0.0
+            bmax = 0.0
+            blog = 0.0
+            for k in range(lo, hi):
+                q = x[k] * x[k]
+                bp += q
+                bmax = max(bmax, q)
+                blog += math.log(q + 1e-30)
+            n = hi - lo
+            #an empty band has no mean, same as the numpy versions
+            if n == 0:
+                out[m, 3 + b] = np.nan
+                out[m, 6 + b] = np.nan
+                out[m, 9 + b] = np.nan
+                continue
+            out[m, 3 + b] = bp / win_sum / v if v != 0.0 else 0.0
+            out[m, 6 + b] = math.exp(blog / n) / (bp / n) if bp != 0.0 else 0.0
+            out[m, 9 + b] = bmax * n / bp if bp != 0.0 else np.nan
+
+#keyed by the cached spectrogram they were computed from, like _stft_cache is by its signal
+_features_cache = collections.OrderedDict()
+
+def compute_features_cached(signal, sr, min_frame_dur, overlap):
+    spec, freqs, l = compute_stft_cached(signal, sr, min_frame_dur, overlap)
+    key = id(spec)
+    entry = _features_cache.get(key)
+    if entry is not None and entry[0] is spec:
+        _features_cache.move_to_end(key)
+        return entry[1]
+
+    slice1, slice2, slice3 = _band_slices(sr, spec.shape[1])
+    edges = np.array([slice1.start, slice2.start, slice3.start, slice3.stop], dtype=np.int64)
+    #below 8.8kHz the upper bands reach past the Nyquist bin, numpy slicing stops at the end of the row
+    #and so does the kernel - it has no bounds checks of its own
+    np.minimum(edges, spec.shape[1], out=edges)
+    win_sum = float(np.sum(get_window('hamming', l)))
+    features = np.empty((spec.shape[0], _N_FEATURES))
+    _frame_features(spec, freqs, edges, win_sum, features)
+    features.setflags(write=False)
+
+    _features_cache[key] = (spec, features)
+    if len(_features_cache) > _STFT_CACHE_SIZE:
+        _features_cache.popitem(last=False)
+    return features
+
+#both caches hold their signal and full spectrogram, so they're emptied when a new file replaces the old one
+#rather than keeping previous recordings alive until they're evicted
+def clear_caches():
+    _stft_cache.clear()
+    _features_cache.clear()
+
+#compiles (or loads from numba's cache) every kernel on tiny inputs, so it isn't the first file or click that pays for it
+def warmup():
+    x = np.linspace(-1, 1, 64, dtype=np.float32)
+    max_abs(x)
+    pcm_to_float32((x * 1000).astype(np.int16))
+    minmax_envelope(x, 64, 4)
+    spectrum_db(x.copy(), 64)
+    #through the real entry point, the kernel is compiled per argument type and the spectrogram is read-only
+    compute_features_cached(np.tile(x, 8), 8000, 0.02, 0.5)
+
+def plot_volume(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
+    fig.clear()
+    vols = compute_features_cached(signal, sr, min_frame_dur, overlap)[:, 0]
 
     total_duration = len(signal) / sr
     sns.set_theme(style="darkgrid")
@@ -181,16 +452,9 @@ def plot_volume(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
     ax.set_xticks(np.linspace(0, len(vols), 10))
     ax.set_xticklabels([f"{t:.2f}s" for t in np.linspace(0, total_duration, 10)])
 
-    fig.tight_layout()
-
 def plot_frequency_centroid(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
     fig.clear()
-    l = frame_length(sr, min_frame_dur)
-    frames = frame_signal(signal, l, overlap)
-    windowed_frames = np.array([window_signal(frame, 'hamming') for frame in frames])
-    spec, freqs = dtft(windowed_frames, sr)
-    spec = np.abs(spec)
-    centroids = [frequency_centroid(frame, freqs) for frame in spec]
+    centroids = compute_features_cached(signal, sr, min_frame_dur, overlap)[:, 1]
 
     total_duration = len(signal) / sr
     sns.set_theme(style="darkgrid")
@@ -205,16 +469,9 @@ def plot_frequency_centroid(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
     ax.set_xticks(np.linspace(0, len(centroids), 10))
     ax.set_xticklabels([f"{t:.2f}s" for t in np.linspace(0, total_duration, 10)])
 
-    fig.tight_layout()
-
 def plot_ef_bandwidth(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
     fig.clear()
-    l = frame_length(sr, min_frame_dur)
-    frames = frame_signal(signal, l, overlap)
-    windowed_frames = np.array([window_signal(frame, 'hamming') for frame in frames])
-    spec, freqs = dtft(windowed_frames, sr)
-    spec = np.abs(spec)
-    bandwidths = [effective_bandwidth(frame, freqs) for frame in spec]
+    bandwidths = compute_features_cached(signal, sr, min_frame_dur, overlap)[:, 2]
     ef_v = np.var(bandwidths)**(1/2)
 
     total_duration = len(signal) / sr
@@ -232,23 +489,8 @@ def plot_ef_bandwidth(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
 
 def plot_ber(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
     fig.clear()
-    l = frame_length(sr, min_frame_dur)
-    frames = frame_signal(signal, l, overlap)
-    windowed_frames = np.array([window_signal(frame, 'hamming') for frame in frames])
-    spec, freqs = dtft(windowed_frames, sr)
-    spec = np.abs(spec)
-    f0,f1,f2,f3 = 0, 630, 1720, 4400
-    num_freq_bins = spec.shape[1]
-    idx0 = 0
-    idx1 = int(f1 / (sr / 2) * (num_freq_bins - 1))
-    idx2 = int(f2 / (sr / 2) * (num_freq_bins - 1))
-    idx3 = int(f3 / (sr / 2) * (num_freq_bins - 1))
-    band1 = spec[:, idx0:idx1]
-    band2 = spec[:, idx1:idx2]
-    band3 = spec[:, idx2:idx3]
-    esrb1 = [ESRB(l, frame, vol(spec[i])) for i,frame in enumerate(band1)]
-    esrb2 = [ESRB(l, frame, vol(spec[i])) for i,frame in enumerate(band2)]
-    esrb3 = [ESRB(l, frame, vol(spec[i])) for i,frame in enumerate(band3)]
+    features = compute_features_cached(signal, sr, min_frame_dur, overlap)
+    esrb1, esrb2, esrb3 = features[:, 3], features[:, 4], features[:, 5]
 
     total_duration = len(signal) / sr
     sns.set_theme(style="darkgrid")
@@ -268,23 +510,8 @@ def plot_ber(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
 
 def plot_sfm(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
     fig.clear()
-    l = frame_length(sr, min_frame_dur)
-    frames = frame_signal(signal, l, overlap)
-    windowed_frames = np.array([window_signal(frame, 'hamming') for frame in frames])
-    spec, freqs = dtft(windowed_frames, sr)
-    spec = np.abs(spec)
-    f0, f1, f2, f3 = 0, 630, 1720, 4400
-    num_freq_bins = spec.shape[1]
-    idx0 = 0
-    idx1 = int(f1 / (sr / 2) * (num_freq_bins - 1))
-    idx2 = int(f2 / (sr / 2) * (num_freq_bins - 1))
-    idx3 = int(f3 / (sr / 2) * (num_freq_bins - 1))
-    band1 = spec[:, idx0:idx1]
-    band2 = spec[:, idx1:idx2]
-    band3 = spec[:, idx2:idx3]
-    sfm1 = [SFM(frame) for frame in band1]
-    sfm2 = [SFM(frame) for frame in band2]
-    sfm3 = [SFM(frame) for frame in band3]
+    features = compute_features_cached(signal, sr, min_frame_dur, overlap)
+    sfm1, sfm2, sfm3 = features[:, 6], features[:, 7], features[:, 8]
 
     total_duration = len(signal) / sr
     sns.set_theme(style="darkgrid")
@@ -304,23 +531,8 @@ def plot_sfm(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
 
 def plot_scf(fig, sr, signal, overlap=0.5, min_frame_dur=0.2):
     fig.clear()
-    l = frame_length(sr, min_frame_dur)
-    frames = frame_signal(signal, l, overlap)
-    windowed_frames = np.array([window_signal(frame, 'hamming') for frame in frames])
-    spec, freqs = dtft(windowed_frames, sr)
-    spec = np.abs(spec)
-    f0, f1, f2, f3 = 0, 630, 1720, 4400
-    num_freq_bins = spec.shape[1]
-    idx0 = 0
-    idx1 = int(f1 / (sr / 2) * (num_freq_bins - 1))
-    idx2 = int(f2 / (sr / 2) * (num_freq_bins - 1))
-    idx3 = int(f3 / (sr / 2) * (num_freq_bins - 1))
-    band1 = spec[:, idx0:idx1]
-    band2 = spec[:, idx1:idx2]
-    band3 = spec[:, idx2:idx3]
-    scf1 = [SCF(frame) for frame in band1]
-    scf2 = [SCF(frame) for frame in band2]
-    scf3 = [SCF(frame) for frame in band3]
+    features = compute_features_cached(signal, sr, min_frame_dur, overlap)
+    scf1, scf2, scf3 = features[:, 9], features[:, 10], features[:, 11]
 
     total_duration = len(signal) / sr
     sns.set_theme(style="darkgrid")
@@ -377,65 +589,57 @@ def main():
 
 
 def IFFT(list):
-    n = len(list)
-    if n == 1:
-        # stała jest wartością wielomianu stopnia 0 w w_0
-        return list
-    w = cmath.exp(-2 * math.pi*1j / n)
-
-    e_val = IFFT(list[::2])
-    o_val = IFFT(list[1::2])
-    ret = [0] * n
-    for i in range(n // 2):
-        ret[i] = e_val[i] + (w**i * o_val[i])
-        ret[i + n // 2] = e_val[i] - (w**i * o_val[i])
-
-    return np.array(ret)
+    return np.fft.ifft(np.asarray(list)) * len(list)
 
 def full_IFFT(list):
-    n = len(list)
-    return np.array(IFFT(list))/n
+    return np.fft.ifft(np.asarray(list))
 
 def get_normalized_mono(path):
     sr, signal = wavfile.read(path)
     if signal.dtype != np.float32:
-        signal = signal / np.max(np.abs(signal))
+        #single precision is plenty for analysis and halves the memory every FFT has to move
+        signal = signal.astype(np.float32)
+        signal /= np.max(np.abs(signal))
     if signal.ndim == 2:
         signal = signal[:, 0]
     return (sr, signal)
 
+#all features below reduce along the last axis, so they take a single frame
+#as well as a whole (M, K) spectrogram and return one value per frame
+def _safe_divide(up, den):
+    up, den = np.broadcast_arrays(np.asarray(up, dtype=float), np.asarray(den, dtype=float))
+    return np.divide(up, den, out=np.zeros_like(up), where=den != 0)
+
+#FC = sum(f*|X|) / sum(|X|)
 def frequency_centroid(fft, frequencies):
-    den = np.sum(fft)**2
-    if den == 0:
-        return 0
-    to_sum_up = fft * frequencies
-    up = sum(to_sum_up**2)
-    return (up/den)**(1/2)
+    den = np.sum(fft, axis=-1)
+    up = np.sum(fft * frequencies, axis=-1)
+    return _safe_divide(up, den)
+#BW^2 = sum((f - FC)^2 * |X|^2) / sum(|X|^2)
 def effective_bandwidth(fft, frequencies):
     fc = frequency_centroid(fft, frequencies)
-    den = np.sum(fft)
-    if den == 0:
-        return 0
-    to_sum_up = (frequencies - fc) * fft
-    up = np.sum(to_sum_up)
-    return up/den
+    pw = fft**2
+    den = np.sum(pw, axis=-1)
+    up = np.sum((frequencies - fc[..., None])**2 * pw, axis=-1)
+    return np.sqrt(_safe_divide(up, den))
 #function above it will filter fft to desired frequencies
 def ESRB(N, fft, vol):
-    if vol == 0:
-        return 0
-    den = np.sum(np.hamming(N))
-    be = np.sum(fft**2)/den
-    return be/vol
+    den = np.sum(get_window('hamming', N))
+    be = np.sum(fft**2, axis=-1)/den
+    return _safe_divide(be, vol)
+#geometric mean through exp(mean(log)), np.prod of a whole band underflows to 0
 def SFM(fft):
-    N = len(fft)
-    return np.prod(fft**2)**(1/N)*N/np.sum(fft**2)
+    pw = fft**2
+    geo = np.exp(np.mean(np.log(pw + 1e-30), axis=-1))
+    arith = np.mean(pw, axis=-1)
+    return _safe_divide(geo, arith)
 
 def SCF(fft):
-    N = len(fft)
-    return np.max(fft**2)*N/np.sum(fft**2)
+    N = fft.shape[-1]
+    pw = fft**2
+    return np.max(pw, axis=-1)*N/np.sum(pw, axis=-1)
 def vol(fft):
-    return np.mean(fft**2)
-
+    return np.mean(fft**2, axis=-1)
 
 
 
@@ -3,7 +3,8 @@ import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QAction, QFileDialog, QTabWidget,
                              QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton,
                              QLabel, QSlider, QSplitter, QMessageBox)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
@@ -16,6 +17,41 @@ from matplotlib.widgets import SpanSelector
 # Import functions from separate file
 from functions import *
 
+# Waveforms are drawn from hundreds of thousands of vertices - let Agg simplify the paths
+# and stroke them in chunks instead of as one huge path
+mpl.rcParams['agg.path.chunksize'] = 10000
+mpl.rcParams['path.simplify'] = True
+mpl.rcParams['path.simplify_threshold'] = 1.0
+
+
+class WorkerSignals(QObject):
+    """Signals a Worker uses to hand its result back to the GUI thread"""
+    finished = pyqtSignal(object, object)  # (tag, result)
+    error = pyqtSignal(object, str)  # (tag, message)
+
+
+class Worker(QRunnable):
+    """Run a function on the thread pool and report back through queued signals.
+
+    Only the computation runs here - anything touching a figure or canvas
+    has to happen in the slot, on the GUI thread.
+    """
+    def __init__(self, tag, fn, *args, **kwargs):
+        super().__init__()
+        self.tag = tag
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(self.tag, str(e))
+        else:
+            self.signals.finished.emit(self.tag, result)
+
 
 class AudioAnalyzerApp(QMainWindow):
     def __init__(self):
@@ -27,6 +63,11 @@ class AudioAnalyzerApp(QMainWindow):
         self.selected_region = None  # Will store (start_index, end_index) of selection
         self.sample_rate = None
         self.file_path = None
+        self.max_amp = None  # Peak absolute amplitude of audio_data, computed once per loaded file
+        self.time_axis = None  # Sample times of audio_data in seconds, computed once per loaded file
+        self._td_envelope = None  # (canvas width, time, envelope) shared by the time domain and window function tabs
+        self._window_function_signal = None  # audio_data the window tab's main plot currently shows
+        self._selection_buffer = np.empty(0, dtype=np.float32)  # Windowed selection of the window function tab
 
         # Add span selector objects
         self.time_domain_span_selector = None
@@ -38,6 +79,27 @@ class AudioAnalyzerApp(QMainWindow):
         self.spec_overlap = 0.5
         self.max_spec_freq = 2000
 
+        # Heavy computations run on the thread pool, every request gets a new job id
+        # so results of requests that were superseded in the meantime can be dropped
+        self.pool = QThreadPool.globalInstance()
+        self._load_job = 0
+        self._spectrogram_job = 0
+        self._f0_job = 0
+
+        # Tabs whose plots are out of date, they are only redrawn once they're shown
+        self._dirty = {0: False, 1: False, 2: False, 3: False, 4: False}
+
+        # Spectrogram parameter changes restart this timer, so keyboard, wheel and page steps only recompute
+        # once they settle. While a slider is dragged only its label follows, releasing it recomputes
+        self._spec_timer = QTimer(self)
+        self._spec_timer.setSingleShot(True)
+        self._spec_timer.timeout.connect(self.update_spectrogram)
+
+        # Same for the acoustic feature sliders, the features follow once the slider rests
+        self._acoustic_timer = QTimer(self)
+        self._acoustic_timer.setSingleShot(True)
+        self._acoustic_timer.timeout.connect(self.refresh_acoustic_features)
+
         self.init_ui()
 
     def init_ui(self):
@@ -74,60 +136,99 @@ class AudioAnalyzerApp(QMainWindow):
 
         self.tabs.currentChanged.connect(self.handle_tab_changed)
 
+        # The signal axes are never recreated, so their span selectors are set up once here
+        self.setup_span_selectors()
+
         # Add status bar
         self.statusBar().showMessage('Ready')
 
         self.show()
 
     def open_audio_file(self):
-        """Open a WAV file and load its data"""
+        """Open a WAV file, it is read and converted on the thread pool and shown in on_audio_loaded"""
         filename, _ = QFileDialog.getOpenFileName(self, "Open Audio File", "", "WAV Files (*.wav)")
 
         if not filename:
             return  # User canceled the dialog
 
-        try:
-            # Check if the file exists
-            if not os.path.exists(filename):
-                QMessageBox.critical(self, "Error", f"File not found: {filename}")
-                return
+        # Check if the file exists
+        if not os.path.exists(filename):
+            QMessageBox.critical(self, "Error", f"File not found: {filename}")
+            return
 
-            # Try to load the WAV file
-            self.sample_rate, audio_data = wavfile.read(filename)
+        self._load_job += 1
+        self.statusBar().showMessage(f"Loading {os.path.basename(filename)}...")
 
-            # Handle multi-channel audio by taking the first channel
-            if len(audio_data.shape) > 1:
-                self.audio_data = audio_data[:, 0]  # Take first channel
-            else:
-                self.audio_data = audio_data
+        worker = Worker((self._load_job, filename), self.read_audio_file, filename)
+        worker.signals.finished.connect(self.on_audio_loaded)
+        worker.signals.error.connect(self.on_audio_load_error)
+        self.pool.start(worker)
 
-            # Convert data to float for processing if needed
-            if self.audio_data.dtype != np.float32 and self.audio_data.dtype != np.float64:
-                self.audio_data = self.audio_data.astype(np.float32)
+    @staticmethod
+    def read_audio_file(filename):
+        """Read a WAV file into normalized float32 mono, runs on a worker thread so it mustn't touch the GUI"""
+        # Try to load the WAV file, memory-mapped so samples are only paged in when converted below
+        try:
+            sample_rate, audio_data = wavfile.read(filename, mmap=True)
+        except ValueError:
+            # 24-bit files can't be memory-mapped, read them the usual way
+            sample_rate, audio_data = wavfile.read(filename)
+
+        # Handle multi-channel audio by taking the first channel
+        if len(audio_data.shape) > 1:
+            audio_data = audio_data[:, 0]  # Take first channel
+
+        # Convert data to float32 for processing, single precision is plenty for analysis and plotting
+        if audio_data.dtype != np.float32 and audio_data.dtype != np.float64:
+            # Normalize the data between -1.0 and 1.0 if it's in integer format,
+            # converted and scaled in a single pass over the mapped file
+            audio_data = pcm_to_float32(audio_data)
+        else:
+            # Float files (float64 ones included) are already normalized, only the precision changes
+            audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+
+        # The y-limits of the full-signal plots only depend on the peak, which can't change until the next load
+        max_amp = max_abs(audio_data)
+        # Float64 on purpose: float32 can't tell neighbouring sample times apart past ~2^24 samples,
+        # and zoomed-in ranges are plotted straight against slices of it
+        time_axis = np.arange(len(audio_data)) / sample_rate
+        return sample_rate, audio_data, max_amp, time_axis
+
+    def on_audio_loaded(self, tag, result):
+        """Take over a file read by read_audio_file and redraw, unless another file was opened since"""
+        job, filename = tag
+        if job != self._load_job:
+            return
 
-                # Normalize the data between -1.0 and 1.0 if it's in integer format
-                max_value = np.iinfo(audio_data.dtype).max
-                self.audio_data = self.audio_data / max_value
+        self.sample_rate, self.audio_data, self.max_amp, self.time_axis = result
+        self._td_envelope = None
+        # Spectrograms and features of the previous file are never asked for again
+        clear_caches()
 
-            # Store the file path and update window title
-            self.file_path = filename
-            self.setWindowTitle(f"Audio Signal Analyzer - {os.path.basename(filename)}")
+        # Store the file path and update window title
+        self.file_path = filename
+        self.setWindowTitle(f"Audio Signal Analyzer - {os.path.basename(filename)}")
 
-            # Show loading info in status bar
-            duration = len(self.audio_data) / self.sample_rate
-            self.statusBar().showMessage(f"Loaded: {os.path.basename(filename)} | "
-                                         f"Sample rate: {self.sample_rate} Hz | "
-                                         f"Duration: {duration:.2f} seconds")
+        # Show loading info in status bar
+        duration = len(self.audio_data) / self.sample_rate
+        self.statusBar().showMessage(f"Loaded: {os.path.basename(filename)} | "
+                                     f"Sample rate: {self.sample_rate} Hz | "
+                                     f"Duration: {duration:.2f} seconds")
 
-            # Reset the selected region
-            self.selected_region = None
+        # Reset the selected region, including the spans still drawn for the previous file
+        self.selected_region = None
+        self.setup_span_selectors()
 
-            # Update all plots with the new data
-            self.update_all_plots()
+        # Update all plots with the new data
+        self.update_all_plots()
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load audio file: {str(e)}")
-            self.statusBar().showMessage(f"Error loading {os.path.basename(filename)}: {str(e)}")
+    def on_audio_load_error(self, tag, message):
+        """Report a file that couldn't be read"""
+        job, filename = tag
+        if job != self._load_job:
+            return
+        QMessageBox.critical(self, "Error", f"Failed to load audio file: {message}")
+        self.statusBar().showMessage(f"Error loading {os.path.basename(filename)}: {message}")
 
     def setup_tab1(self):
         tab = QWidget()
@@ -139,7 +240,7 @@ class AudioAnalyzerApp(QMainWindow):
         # Main signal plot
         main_plot_widget = QWidget()
         main_plot_layout = QVBoxLayout()
-        main_figure = Figure(figsize=(10, 4))
+        main_figure = Figure(figsize=(10, 4), constrained_layout=True)
         main_canvas = FigureCanvas(main_figure)
         main_toolbar = NavigationToolbar(main_canvas, self)
         main_plot_layout.addWidget(main_toolbar)
@@ -160,7 +261,7 @@ class AudioAnalyzerApp(QMainWindow):
         subsection_label = QLabel("Selected Fragment:")
         layout.addWidget(subsection_label)
 
-        subsection_figure = Figure(figsize=(10, 2))
+        subsection_figure = Figure(figsize=(10, 2), constrained_layout=True)
         subsection_canvas = FigureCanvas(subsection_figure)
         layout.addWidget(subsection_canvas)
 
@@ -170,9 +271,26 @@ class AudioAnalyzerApp(QMainWindow):
         # Store references to canvas and figures for later updates
         self.time_domain_main_figure = main_figure
         self.time_domain_main_canvas = main_canvas
+        self.time_domain_main_toolbar = main_toolbar
         self.time_domain_subsection_figure = subsection_figure
         self.time_domain_subsection_canvas = subsection_canvas
 
+        # Axes and lines are created once, refreshes only swap their data and limits
+        self.time_domain_main_ax = main_figure.add_subplot(111)
+        self.time_domain_main_line, = self.time_domain_main_ax.plot([], [], antialiased=False, rasterized=True)
+        self.time_domain_main_ax.set_xlabel('Time (s)')
+        self.time_domain_main_ax.set_ylabel('Amplitude')
+        self.time_domain_main_ax.set_title('Time Domain Signal')
+        self.time_domain_main_ax.grid(True, linestyle='--', alpha=0.7)
+        self.time_domain_main_ax.callbacks.connect('xlim_changed', self.on_signal_xlim_changed)
+
+        self.time_domain_subsection_ax = subsection_figure.add_subplot(111)
+        self.time_domain_subsection_line, = self.time_domain_subsection_ax.plot([], [], antialiased=False, rasterized=True)
+        self.time_domain_subsection_ax.set_xlabel('Time (s)')
+        self.time_domain_subsection_ax.set_ylabel('Amplitude')
+        self.time_domain_subsection_ax.set_title('Selected Region')
+        self.time_domain_subsection_ax.grid(True, linestyle='--', alpha=0.7)
+
     def setup_tab2(self):
         """Set up the acoustic features tab with 6 different plots"""
         tab = QWidget()
@@ -187,101 +305,12 @@ class AudioAnalyzerApp(QMainWindow):
         title_label.setFont(font)
         main_layout.addWidget(title_label)
 
-        # Create a 3x2 grid layout for the six plots
-        grid_layout = QVBoxLayout()
-
-        # First row: Volume and Frequency Centroid
-        row1_layout = QHBoxLayout()
-
-        # Volume plot
-        volume_widget = QWidget()
-        volume_layout = QVBoxLayout()
-        volume_label = QLabel("Volume (Vol)")
-        volume_layout.addWidget(volume_label)
-
-        volume_figure = Figure(figsize=(5, 3))
-        volume_canvas = FigureCanvas(volume_figure)
-        volume_layout.addWidget(volume_canvas)
-        volume_widget.setLayout(volume_layout)
-
-        # Frequency Centroid plot
-        fc_widget = QWidget()
-        fc_layout = QVBoxLayout()
-        fc_label = QLabel("Frequency Centroid (FC)")
-        fc_layout.addWidget(fc_label)
-
-        fc_figure = Figure(figsize=(5, 3))
-        fc_canvas = FigureCanvas(fc_figure)
-        fc_layout.addWidget(fc_canvas)
-        fc_widget.setLayout(fc_layout)
-
-        # Add to first row
-        row1_layout.addWidget(volume_widget)
-        row1_layout.addWidget(fc_widget)
-        grid_layout.addLayout(row1_layout)
-
-        # Second row: Effective Bandwidth and Band Energy Ratio
-        row2_layout = QHBoxLayout()
-
-        # Effective Bandwidth plot
-        bw_widget = QWidget()
-        bw_layout = QVBoxLayout()
-        bw_label = QLabel("Effective Bandwidth (BW)")
-        bw_layout.addWidget(bw_label)
-
-        bw_figure = Figure(figsize=(5, 3))
-        bw_canvas = FigureCanvas(bw_figure)
-        bw_layout.addWidget(bw_canvas)
-        bw_widget.setLayout(bw_layout)
-
-        # Band Energy Ratio plot
-        ber_widget = QWidget()
-        ber_layout = QVBoxLayout()
-        ber_label = QLabel("Band Energy Ratio (BER)")
-        ber_layout.addWidget(ber_label)
-
-        ber_figure = Figure(figsize=(5, 3))
-        ber_canvas = FigureCanvas(ber_figure)
-        ber_layout.addWidget(ber_canvas)
-        ber_widget.setLayout(ber_layout)
-
-        # Add to second row
-        row2_layout.addWidget(bw_widget)
-        row2_layout.addWidget(ber_widget)
-        grid_layout.addLayout(row2_layout)
-
-        # Third row: Spectral Flatness Measure and Spectral Crest Factor
-        row3_layout = QHBoxLayout()
-
-        # Spectral Flatness Measure plot
-        sfm_widget = QWidget()
-        sfm_layout = QVBoxLayout()
-        sfm_label = QLabel("Spectral Flatness Measure (SFM)")
-        sfm_layout.addWidget(sfm_label)
-
-        sfm_figure = Figure(figsize=(5, 3))
-        sfm_canvas = FigureCanvas(sfm_figure)
-        sfm_layout.addWidget(sfm_canvas)
-        sfm_widget.setLayout(sfm_layout)
-
-        # Spectral Crest Factor plot
-        scf_widget = QWidget()
-        scf_layout = QVBoxLayout()
-        scf_label = QLabel("Spectral Crest Factor (SCF)")
-        scf_layout.addWidget(scf_label)
-
-        scf_figure = Figure(figsize=(5, 3))
-        scf_canvas = FigureCanvas(scf_figure)
-        scf_layout.addWidget(scf_canvas)
-        scf_widget.setLayout(scf_layout)
-
-        # Add to third row
-        row3_layout.addWidget(sfm_widget)
-        row3_layout.addWidget(scf_widget)
-        grid_layout.addLayout(row3_layout)
-
-        # Add the grid layout to the main layout
-        main_layout.addLayout(grid_layout)
+        # All six plots share one figure and canvas, so an update renders once instead of six times.
+        # Each plot gets a subfigure of a 3x2 grid, which it can clear and lay out on its own
+        acoustic_figure = Figure(figsize=(10, 9), constrained_layout=True)
+        acoustic_canvas = FigureCanvas(acoustic_figure)
+        subfigures = acoustic_figure.subfigures(3, 2)
+        main_layout.addWidget(acoustic_canvas)
 
         # Add analysis controls at the bottom (optional)
         controls_layout = QHBoxLayout()
@@ -308,7 +337,7 @@ class AudioAnalyzerApp(QMainWindow):
 
         hop_size_slider = QSlider(Qt.Horizontal)
         hop_size_slider.setMinimum(10)  # 10%
-        hop_size_slider.setMaximum(100)  # 100%
+        hop_size_slider.setMaximum(99)  # 99%, at 100% frames would never advance
         hop_size_slider.setValue(50)  # Default 50%
         hop_size_slider.setTickPosition(QSlider.TicksBelow)
         hop_size_slider.setTickInterval(10)
@@ -328,23 +357,12 @@ class AudioAnalyzerApp(QMainWindow):
         tab.setLayout(main_layout)
         self.tabs.addTab(tab, "Acoustic Features")
 
-        # Store references to the figures and canvases
+        # Store references to the figure, its canvas and the subfigure of every plot
+        self.acoustic_figure = acoustic_figure
+        self.acoustic_canvas = acoustic_canvas
         self.acoustic_figures = {
-            'volume': volume_figure,
-            'fc': fc_figure,
-            'bw': bw_figure,
-            'ber': ber_figure,
-            'sfm': sfm_figure,
-            'scf': scf_figure
-        }
-
-        self.acoustic_canvases = {
-            'volume': volume_canvas,
-            'fc': fc_canvas,
-            'bw': bw_canvas,
-            'ber': ber_canvas,
-            'sfm': sfm_canvas,
-            'scf': scf_canvas
+            name: subfigure
+            for name, subfigure in zip(('volume', 'fc', 'bw', 'ber', 'sfm', 'scf'), subfigures.flat)
         }
 
         # Store references to the sliders and their value labels
@@ -367,7 +385,7 @@ class AudioAnalyzerApp(QMainWindow):
         # Main signal plot (same as tab 1)
         main_plot_widget = QWidget()
         main_plot_layout = QVBoxLayout()
-        main_figure = Figure(figsize=(10, 4))
+        main_figure = Figure(figsize=(10, 4), constrained_layout=True)
         main_canvas = FigureCanvas(main_figure)
         main_toolbar = NavigationToolbar(main_canvas, self)
         main_plot_layout.addWidget(main_toolbar)
@@ -405,7 +423,7 @@ class AudioAnalyzerApp(QMainWindow):
         windowed_label = QLabel("Windowed Signal (Time Domain):")
         windowed_layout.addWidget(windowed_label)
 
-        windowed_figure = Figure(figsize=(5, 3))
+        windowed_figure = Figure(figsize=(5, 3), constrained_layout=True)
         windowed_canvas = FigureCanvas(windowed_figure)
         windowed_layout.addWidget(windowed_canvas)
         windowed_widget.setLayout(windowed_layout)
@@ -416,7 +434,7 @@ class AudioAnalyzerApp(QMainWindow):
         freq_windowed_label = QLabel("Windowed Signal (Frequency Domain):")
         freq_windowed_layout.addWidget(freq_windowed_label)
 
-        freq_windowed_figure = Figure(figsize=(5, 3))
+        freq_windowed_figure = Figure(figsize=(5, 3), constrained_layout=True)
         freq_windowed_canvas = FigureCanvas(freq_windowed_figure)
         freq_windowed_layout.addWidget(freq_windowed_canvas)
         freq_windowed_widget.setLayout(freq_windowed_layout)
@@ -434,12 +452,22 @@ class AudioAnalyzerApp(QMainWindow):
         # Store references to canvas and figures for later updates
         self.window_function_main_figure = main_figure
         self.window_function_main_canvas = main_canvas
+        self.window_function_main_toolbar = main_toolbar
         self.windowed_figure = windowed_figure
         self.windowed_canvas = windowed_canvas
         self.freq_windowed_figure = freq_windowed_figure
         self.freq_windowed_canvas = freq_windowed_canvas
         self.window_combo = window_combo
 
+        # Like the time domain tab, the main axes live as long as the tab
+        self.window_function_main_ax = main_figure.add_subplot(111)
+        self.window_function_main_line, = self.window_function_main_ax.plot([], [], antialiased=False, rasterized=True)
+        self.window_function_main_ax.set_xlabel('Time (s)')
+        self.window_function_main_ax.set_ylabel('Amplitude')
+        self.window_function_main_ax.set_title('Time Domain Signal (for windowing)')
+        self.window_function_main_ax.grid(True, linestyle='--', alpha=0.7)
+        self.window_function_main_ax.callbacks.connect('xlim_changed', self.on_signal_xlim_changed)
+
     def setup_tab4(self):
         tab = QWidget()
         layout = QVBoxLayout()
@@ -469,6 +497,7 @@ class AudioAnalyzerApp(QMainWindow):
         self.frame_dur_slider.setTickInterval(20)
         self.frame_dur_value_label = QLabel("50 ms")
         self.frame_dur_slider.valueChanged.connect(self.on_frame_dur_changed)
+        self.frame_dur_slider.sliderReleased.connect(self.update_spectrogram)
 
         frame_dur_layout.addWidget(frame_dur_label)
         frame_dur_layout.addWidget(self.frame_dur_slider)
@@ -486,6 +515,7 @@ class AudioAnalyzerApp(QMainWindow):
         self.overlap_slider.setTickInterval(10)
         self.overlap_value_label = QLabel("0.50")
         self.overlap_slider.valueChanged.connect(self.on_overlap_changed)
+        self.overlap_slider.sliderReleased.connect(self.update_spectrogram)
 
         overlap_layout.addWidget(overlap_label)
         overlap_layout.addWidget(self.overlap_slider)
@@ -503,6 +533,7 @@ class AudioAnalyzerApp(QMainWindow):
         self.max_freq_slider.setTickInterval(100)
         self.max_freq_value_label = QLabel("2000Hz")
         self.max_freq_slider.valueChanged.connect(self.on_max_freq_changed)
+        self.max_freq_slider.sliderReleased.connect(self.update_spectrogram)
 
         max_freq_layout.addWidget(max_freq_label)
         max_freq_layout.addWidget(self.max_freq_slider)
@@ -520,9 +551,10 @@ class AudioAnalyzerApp(QMainWindow):
         spectrogram_label = QLabel("Spectrogram:")
         layout.addWidget(spectrogram_label)
 
-        self.spectrogram_figure = Figure(figsize=(10, 6))
+        self.spectrogram_figure = Figure(figsize=(10, 6), constrained_layout=True)
         self.spectrogram_canvas = FigureCanvas(self.spectrogram_figure)
         self.spectrogram_toolbar = NavigationToolbar(self.spectrogram_canvas, self)
+        self.spectrogram_image = None  # Created by the first draw, later ones only swap its data
         layout.addWidget(self.spectrogram_toolbar)
         layout.addWidget(self.spectrogram_canvas)
 
@@ -536,7 +568,7 @@ class AudioAnalyzerApp(QMainWindow):
         fundamental_freq_label = QLabel("Fundamental Frequency Over Time:")
         layout.addWidget(fundamental_freq_label)
 
-        fundamental_freq_figure = Figure(figsize=(10, 6))
+        fundamental_freq_figure = Figure(figsize=(10, 6), constrained_layout=True)
         fundamental_freq_canvas = FigureCanvas(fundamental_freq_figure)
         fundamental_freq_toolbar = NavigationToolbar(fundamental_freq_canvas, self)
         layout.addWidget(fundamental_freq_toolbar)
@@ -607,29 +639,28 @@ class AudioAnalyzerApp(QMainWindow):
         # Create window function
         n = len(data_to_window)
         if n > 0:
-            if window_type == "rectangular":
-                window = np.ones(n)
-            elif window_type == "triangular":
-                window = np.bartlett(n)
-            elif window_type == "hamming":
-                window = np.hamming(n)
-            elif window_type == "hanning":
-                window = np.hanning(n)
-            elif window_type == "blackman":
-                window = np.blackman(n)
-            else:
-                window = np.ones(n)  # Default to rectangular
-
-            # Apply window function
-            windowed_data = data_to_window * window
+            # Cached per (type, length), repeated refreshes of the same selection reuse the coefficients
+            try:
+                window = get_window(window_type, n)
+            except ValueError:
+                window = get_window("rectangular", n)  # Default to rectangular
+
+            # Apply window function into a float32 buffer that only ever grows, instead of a new array per update,
+            # the FFT below runs in single precision and may use it as scratch space once it's plotted
+            if n > self._selection_buffer.size:
+                self._selection_buffer = np.empty(n, dtype=np.float32)
+            windowed_data = self._selection_buffer[:n]
+            np.multiply(data_to_window, window, out=windowed_data)
 
             # Update time domain windowed plot
             self.windowed_figure.clear()
             ax = self.windowed_figure.add_subplot(111)
 
-            # Plot time domain signal
-            time = np.arange(n) / self.sample_rate
-            ax.plot(time, windowed_data)
+            # Plot time domain signal, as a min/max envelope at the canvas' resolution when there are more
+            # samples than pixels (e.g. the whole file when nothing is selected)
+            time, envelope = minmax_envelope(windowed_data, self.sample_rate,
+                                             self.windowed_canvas.get_width_height()[0], self.time_axis[:n])
+            ax.plot(time, envelope, antialiased=False, rasterized=True)
             ax.set_xlabel('Time (s)')
             ax.set_ylabel('Amplitude')
             ax.set_title(f'Windowed Signal ({window_type})')
@@ -638,12 +669,10 @@ class AudioAnalyzerApp(QMainWindow):
             ax.grid(True, linestyle='--', alpha=0.7)
 
             # Set y-axis limits with some padding
-            max_amp = np.max(np.abs(windowed_data))
+            max_amp = max_abs(windowed_data)
             if max_amp > 0:  # Avoid division by zero
                 ax.set_ylim([-max_amp * 1.1, max_amp * 1.1])
-
-            self.windowed_figure.tight_layout()
-            self.windowed_canvas.draw()
+            self.windowed_canvas.draw_idle()
 
             # Update frequency domain windowed plot
             self.freq_windowed_figure.clear()
@@ -651,13 +680,10 @@ class AudioAnalyzerApp(QMainWindow):
 
             # Compute FFT of the windowed signal
 
-            yf = np.fft.rfft(windowed_data)
-            xf = np.fft.rfftfreq(len(windowed_data), 1 / self.sample_rate)
+            magnitude_db, xf = spectrum_db(windowed_data, self.sample_rate)
 
             # Plot magnitude spectrum in dB
-            magnitude = np.abs(yf)
-            if np.max(magnitude) > 0:  # Avoid log of zero or division by zero
-                magnitude_db = 20 * np.log10(magnitude / np.max(magnitude) + 1e-10)
+            if magnitude_db is not None:  # None for a silent signal, there's no peak to be relative to
 
                 freq_ax.plot(xf, magnitude_db)
                 freq_ax.set_xlabel('Frequency (Hz)')
@@ -670,9 +696,7 @@ class AudioAnalyzerApp(QMainWindow):
                 # Set axis limits
                 freq_ax.set_xlim([0, min(self.sample_rate / 2, 5000)])  # Limit to 5kHz for better visibility
                 freq_ax.set_ylim([-80, 0])
-
-            self.freq_windowed_figure.tight_layout()
-            self.freq_windowed_canvas.draw()
+            self.freq_windowed_canvas.draw_idle()
 
             # Update status bar
             if self.selected_region is None:
@@ -689,102 +713,164 @@ class AudioAnalyzerApp(QMainWindow):
         # Convert slider value (ms) to seconds for the parameter
         self.spec_frame_dur = value / 1000.0
         self.frame_dur_value_label.setText(f"{value} ms")
-        # self.update_spectrogram()
+        self.schedule_spectrogram_update(self.frame_dur_slider)
 
     def on_overlap_changed(self, value):
         """Handle overlap slider change"""
         # Convert slider value (0-99) to decimal (0.0-0.99)
         self.spec_overlap = value / 100.0
         self.overlap_value_label.setText(f"{self.spec_overlap:.2f}")
-        # self.update_spectrogram()
+        self.schedule_spectrogram_update(self.overlap_slider)
 
     def on_spectrogram_param_changed(self, window_type):
         """Handle window type change for spectrogram"""
         self.spec_window = window_type
-        self.update_spectrogram()
+        self._spec_timer.start(150)
 
     def on_max_freq_changed(self, max_freq):
         self.max_spec_freq = max_freq
         self.max_freq_value_label.setText(f"{max_freq}Hz")
-        # self.update_spectrogram()
+        self.schedule_spectrogram_update(self.max_freq_slider)
+
+    def schedule_spectrogram_update(self, slider):
+        """Recompute the spectrogram after a parameter change, unless the slider is still being dragged"""
+        # The new value is already stored, sliderReleased picks it up when the drag ends
+        if not slider.isSliderDown():
+            self._spec_timer.start(150)
 
     def update_spectrogram(self):
-        """Update the spectrogram plot"""
+        """Start computing the spectrogram in the background, it is drawn in on_spectrogram_ready"""
         # Only proceed if we have audio data
         if self.audio_data is None or self.sample_rate is None:
             return
 
+        self._spectrogram_job += 1
+        params = dict(
+            overlap=self.spec_overlap,
+            min_frame_dur=self.spec_frame_dur,
+            window=self.spec_window,
+            max_freq=self.max_spec_freq
+        )
+        total_duration = len(self.audio_data) / self.sample_rate
+
+        worker = Worker((self._spectrogram_job, total_duration, params),
+                        compute_spectrogram, self.sample_rate, self.audio_data, **params)
+        worker.signals.finished.connect(self.on_spectrogram_ready)
+        worker.signals.error.connect(self.on_spectrogram_error)
+        self.pool.start(worker)
+
+    def on_spectrogram_ready(self, tag, spec_db):
+        """Draw a finished spectrogram, unless a newer one has been requested since"""
+        job, total_duration, params = tag
+        if job != self._spectrogram_job:
+            return
+
         try:
-            # Call the imported plot_spectrogram_in_figure function with current parameters
-            plot_spectrogram(
-                self.spectrogram_figure,
-                self.sample_rate,
-                self.audio_data,
-                overlap=self.spec_overlap,
-                min_frame_dur=self.spec_frame_dur,
-                window=self.spec_window,
-                max_freq=self.max_spec_freq
-            )
+            self.spectrogram_image = draw_spectrogram(self.spectrogram_figure, spec_db, total_duration,
+                                                      im=self.spectrogram_image, **params)
             # Update canvas
-            self.spectrogram_canvas.draw()
+            self.spectrogram_canvas.draw_idle()
         except Exception as e:
-            QMessageBox.warning(self, "Spectrogram Error", f"Error updating spectrogram: {str(e)}")
-            print(f"Error updating spectrogram: {e}")
+            self.on_spectrogram_error(tag, str(e))
+
+    def on_spectrogram_error(self, tag, message):
+        if tag[0] != self._spectrogram_job:
+            return
+        QMessageBox.warning(self, "Spectrogram Error", f"Error updating spectrogram: {message}")
+        print(f"Error updating spectrogram: {message}")
 
     def update_all_plots(self):
-        """Update all plots in the application"""
+        """Mark all plots as out of date and redraw the visible tab, the rest follow when they're shown"""
         if self.audio_data is None:
             return
 
-        # Update time domain plots (Tab 1)
-        self.update_time_domain_plots()
+        for index in self._dirty:
+            self._dirty[index] = True
 
-        # Update frequency domain plots (Tab 2)
-        self.update_frequency_domain_plots()
+        self.refresh_tab(self.tabs.currentIndex())
 
-        # Update window function plots (Tab 3)
-        self.update_window_function_plots()
+        # The spectrogram and F0 are computed on the thread pool, so they're started right away
+        # and run alongside each other (and the visible tab) instead of waiting for their tabs
+        self.refresh_tab(3)
+        self.refresh_tab(4)
 
-        # Update spectrogram (Tab 4)
-        self.update_spectrogram()
+    def refresh_tab(self, index):
+        """Redraw the plots of a tab if they are out of date"""
+        if self.audio_data is None or not self._dirty.get(index, False):
+            return
+        self._dirty[index] = False
 
-        # Update fundamental frequency plot (Tab 5)
-        self.update_fundamental_frequency_plot()
+        if index == 0:  # Time Domain
+            self.update_time_domain_plots()
+        elif index == 1:  # Acoustic Features
+            self.update_acoustic_features()
+        elif index == 2:  # Window Function
+            self.update_window_function_plots()
+        elif index == 3:  # Spectrogram
+            self.update_spectrogram()
+        elif index == 4:  # Fundamental Frequency
+            self.update_fundamental_frequency_plot()
 
     def update_time_domain_plots(self):
         """Update the time domain plots in tab 1"""
         if self.audio_data is None or self.sample_rate is None:
             return
 
-        # Clear the figure
-        self.time_domain_main_figure.clear()
-        ax = self.time_domain_main_figure.add_subplot(111)
-
-        # Plot time domain signal
-        time = np.arange(len(self.audio_data)) / self.sample_rate
-        ax.plot(time, self.audio_data)
-        ax.set_xlabel('Time (s)')
-        ax.set_ylabel('Amplitude')
-        ax.set_title('Time Domain Signal')
+        ax = self.time_domain_main_ax
 
-        # Add grid
-        ax.grid(True, linestyle='--', alpha=0.7)
+        # Plot time domain signal, decimated to a min/max envelope of two points per pixel column
+        time, envelope = self.time_domain_envelope(self.time_domain_main_canvas.get_width_height()[0])
+        self.time_domain_main_line.set_data(time, envelope)
+        ax.relim(visible_only=True)
+        # A toolbar zoom turns x autoscaling off, a new signal has to be shown in full again
+        ax.set_autoscalex_on(True)
+        ax.autoscale_view(scaley=False)
+        # Forget the zoom/pan history of the previous file, clearing the figure used to do that
+        self.time_domain_main_toolbar.update()
 
         # Set y-axis limits with some padding
-        max_amp = np.max(np.abs(self.audio_data))
+        max_amp = self.max_amp
         ax.set_ylim([-max_amp * 1.1, max_amp * 1.1])
-
-        self.time_domain_main_figure.tight_layout()
-        self.time_domain_main_canvas.draw()
+        self.time_domain_main_canvas.draw_idle()
 
         # Update subsection plot if we have a selection
         if self.selected_region is not None:
             self.update_time_domain_subsection_plot()
 
+    def on_signal_xlim_changed(self, ax):
+        """Re-decimate a waveform plot for its visible time range after a zoom or pan"""
+        if self.audio_data is None:
+            return
 
-        # Set up span selector again to ensure it's connected to the new plot
-        self.setup_span_selectors()
+        if ax is self.time_domain_main_ax:
+            line, canvas = self.time_domain_main_line, self.time_domain_main_canvas
+        else:
+            line, canvas = self.window_function_main_line, self.window_function_main_canvas
 
+        x0, x1 = ax.get_xlim()
+        start = max(0, int(x0 * self.sample_rate))
+        end = min(len(self.audio_data), int(x1 * self.sample_rate) + 2)
+        if end - start < 2:
+            return
+
+        width = canvas.get_width_height()[0]
+        if start == 0 and end == len(self.audio_data):
+            # Whole signal visible, the shared envelope is already computed
+            time, envelope = self.time_domain_envelope(width)
+        else:
+            time, envelope = minmax_envelope(self.audio_data[start:end], self.sample_rate, width,
+                                             self.time_axis[start:end])
+            # A short range comes back with its own slice of time_axis, only an envelope's times start at 0
+            if envelope.size != end - start:
+                time = time + start / self.sample_rate
+        line.set_data(time, envelope)
+        canvas.draw_idle()
+
+    def time_domain_envelope(self, width):
+        """Min/max envelope of the whole signal for a canvas width, computed once and shared by tabs 1 and 3"""
+        if self._td_envelope is None or self._td_envelope[0] != width:
+            self._td_envelope = (width,) + minmax_envelope(self.audio_data, self.sample_rate, width, self.time_axis)
+        return self._td_envelope[1:]
 
     def update_time_domain_subsection_plot(self):
         """Update the subsection plot in time domain tab"""
@@ -793,41 +879,30 @@ class AudioAnalyzerApp(QMainWindow):
 
         start_idx, end_idx = self.selected_region
 
-        # Clear the figure
-        self.time_domain_subsection_figure.clear()
-        ax = self.time_domain_subsection_figure.add_subplot(111)
+        ax = self.time_domain_subsection_ax
 
         # Get the selected portion of the signal
         selected_data = self.audio_data[start_idx:end_idx]
-        time = np.arange(len(selected_data)) / self.sample_rate
 
-        # Plot time domain signal
-        ax.plot(time, selected_data)
-        ax.set_xlabel('Time (s)')
-        ax.set_ylabel('Amplitude')
-        ax.set_title('Selected Region')
-
-        # Add grid
-        ax.grid(True, linestyle='--', alpha=0.7)
+        # Plot time domain signal, long selections as a min/max envelope at the canvas' resolution
+        time, envelope = minmax_envelope(selected_data, self.sample_rate,
+                                         self.time_domain_subsection_canvas.get_width_height()[0],
+                                         self.time_axis[:len(selected_data)])
+        self.time_domain_subsection_line.set_data(time, envelope)
+        ax.relim(visible_only=True)
+        ax.set_autoscalex_on(True)
+        ax.autoscale_view(scaley=False)
 
         # Set y-axis limits with some padding
-        max_amp = np.max(np.abs(selected_data))
+        max_amp = max_abs(selected_data)
         ax.set_ylim([-max_amp * 1.1, max_amp * 1.1])
-
-        self.time_domain_subsection_figure.tight_layout()
-        self.time_domain_subsection_canvas.draw()
+        self.time_domain_subsection_canvas.draw_idle()
 
     def update_frequency_domain_plots(self):
-        """Update the acoustic features in tab 2"""
-        if self.audio_data is None:
-            return
-
-        # Only calculate if the tab is visible to improve performance
+        """Update the acoustic features in tab 2 if they are out of date"""
+        # Only calculate if the tab is visible to improve performance, otherwise it's refreshed once shown
         if self.tabs.currentIndex() == 1:  # Tab 2 (Acoustic Features)
-            self.update_acoustic_features()
-        else:
-            # Just clear the flag so it will update when the tab becomes visible
-            pass
+            self.refresh_tab(1)
 
 
 
@@ -836,25 +911,23 @@ class AudioAnalyzerApp(QMainWindow):
         if self.audio_data is None or self.sample_rate is None:
             return
 
-        # Update main plot (same as time domain)
-        self.window_function_main_figure.clear()
-        ax = self.window_function_main_figure.add_subplot(111)
-
-        time = np.arange(len(self.audio_data)) / self.sample_rate
-        ax.plot(time, self.audio_data)
-        ax.set_xlabel('Time (s)')
-        ax.set_ylabel('Amplitude')
-        ax.set_title('Time Domain Signal (for windowing)')
-
-        # Add grid
-        ax.grid(True, linestyle='--', alpha=0.7)
+        # Update main plot (same envelope as the time domain tab). A new selection also lands here, the main
+        # plot only changes with the signal though, so the user's zoom is kept until another file is loaded
+        if self._window_function_signal is not self.audio_data:
+            self._window_function_signal = self.audio_data
+            ax = self.window_function_main_ax
+            time, envelope = self.time_domain_envelope(self.window_function_main_canvas.get_width_height()[0])
+            self.window_function_main_line.set_data(time, envelope)
+            ax.relim(visible_only=True)
+            # A toolbar zoom turns x autoscaling off, the new signal has to be shown in full again
+            ax.set_autoscalex_on(True)
+            ax.autoscale_view(scaley=False)
+            self.window_function_main_toolbar.update()
 
-        # Set y-axis limits with some padding
-        max_amp = np.max(np.abs(self.audio_data))
-        ax.set_ylim([-max_amp * 1.1, max_amp * 1.1])
-
-        self.window_function_main_figure.tight_layout()
-        self.window_function_main_canvas.draw()
+            # Set y-axis limits with some padding
+            max_amp = self.max_amp
+            ax.set_ylim([-max_amp * 1.1, max_amp * 1.1])
+            self.window_function_main_canvas.draw_idle()
 
         # Update windowed plots with current window type
         window_type = self.window_combo.currentText()
@@ -872,23 +945,38 @@ class AudioAnalyzerApp(QMainWindow):
         self.update_windowed_plot(window_type)
 
     def update_fundamental_frequency_plot(self):
-        """Update the fundamental frequency plot"""
+        """Start computing the fundamental frequency in the background, it is drawn in on_f0_ready"""
         # Only proceed if we have audio data
         if self.audio_data is None or self.sample_rate is None:
             return
 
+        self._f0_job += 1
+        total_duration = len(self.audio_data) / self.sample_rate
+
+        worker = Worker((self._f0_job, total_duration),
+                        compute_f0_from_cepstrum, self.audio_data, self.sample_rate)
+        worker.signals.finished.connect(self.on_f0_ready)
+        worker.signals.error.connect(self.on_f0_error)
+        self.pool.start(worker)
+
+    def on_f0_ready(self, tag, f0s):
+        """Draw a finished fundamental frequency plot, unless a newer one has been requested since"""
+        job, total_duration = tag
+        if job != self._f0_job:
+            return
+
         try:
-            # Call the imported plot_spectrogram_in_figure function with current parameters
-            plot_f0_from_cepstrum(
-                self.fundamental_freq_figure,
-                self.audio_data,
-                self.sample_rate
-            )
+            draw_f0_from_cepstrum(self.fundamental_freq_figure, f0s, total_duration)
             # Update canvas
-            self.fundamental_freq_canvas.draw()
+            self.fundamental_freq_canvas.draw_idle()
         except Exception as e:
-            QMessageBox.warning(self, "F0 plot Error", f"Error updating f0_plot: {str(e)}")
-            print(f"Error updating f0 plot: {e}")
+            self.on_f0_error(tag, str(e))
+
+    def on_f0_error(self, tag, message):
+        if tag[0] != self._f0_job:
+            return
+        QMessageBox.warning(self, "F0 plot Error", f"Error updating f0_plot: {message}")
+        print(f"Error updating f0 plot: {message}")
 
     def setup_span_selectors(self):
         """Set up span selectors for interactive region selection"""
@@ -898,41 +986,42 @@ class AudioAnalyzerApp(QMainWindow):
 
         # First tab span selector
         if time_ax is not None:
-            # If a previous span selector exists, disconnect it
-            if hasattr(self, 'time_domain_span_selector') and self.time_domain_span_selector is not None:
-                self.time_domain_span_selector.disconnect_events()
-
-            # Create a new span selector with clear visual feedback
-            self.time_domain_span_selector = SpanSelector(
-                time_ax,
-                self.on_time_domain_select,
-                'horizontal',
-                useblit=True,
-                props=dict(alpha=0.3, facecolor='blue'),
-                interactive=True,
-                drag_from_anywhere=True,
-                button=1  # Left mouse button
-            )
+            # The time domain axes are never recreated, so an existing span selector only needs
+            # the previous file's selection cleared
+            if self.time_domain_span_selector is not None:
+                self.time_domain_span_selector.clear()
+            else:
+                # Create a new span selector with clear visual feedback
+                self.time_domain_span_selector = SpanSelector(
+                    time_ax,
+                    self.on_time_domain_select,
+                    'horizontal',
+                    useblit=True,
+                    props=dict(alpha=0.3, facecolor='blue'),
+                    interactive=True,
+                    drag_from_anywhere=True,
+                    button=1  # Left mouse button
+                )
             # Let the user know they can now select
             self.statusBar().showMessage("Click and drag to select a region on the plot", 3000)
 
         # Window function tab span selector
         if window_ax is not None:
-            # If a previous span selector exists, disconnect it
-            if hasattr(self, 'window_function_span_selector') and self.window_function_span_selector is not None:
-                self.window_function_span_selector.disconnect_events()
-
-            # Create new span selector
-            self.window_function_span_selector = SpanSelector(
-                window_ax,
-                self.on_window_function_select,
-                'horizontal',
-                useblit=True,
-                props=dict(alpha=0.3, facecolor='green'),
-                interactive=True,
-                drag_from_anywhere=True,
-                button=1  # Left mouse button
-            )
+            # Same as above, the axes stay so an existing selector is only cleared
+            if self.window_function_span_selector is not None:
+                self.window_function_span_selector.clear()
+            else:
+                # Create new span selector
+                self.window_function_span_selector = SpanSelector(
+                    window_ax,
+                    self.on_window_function_select,
+                    'horizontal',
+                    useblit=True,
+                    props=dict(alpha=0.3, facecolor='green'),
+                    interactive=True,
+                    drag_from_anywhere=True,
+                    button=1  # Left mouse button
+                )
 
         # Add selection callback methods
 
@@ -952,6 +1041,12 @@ class AudioAnalyzerApp(QMainWindow):
         # Store the selected region
         self.selected_region = (start_idx, end_idx)
 
+        # Show the same span on the other tab's plot, selectors only blit their own artists over the saved background
+        for selector in (self.time_domain_span_selector, self.window_function_span_selector):
+            if selector is not None and selector.extents != (xmin, xmax):
+                selector.set_visible(True)
+                selector.extents = (xmin, xmax)
+
         # Update the subsection plots
         self.update_time_domain_subsection_plot()
 
@@ -961,12 +1056,14 @@ class AudioAnalyzerApp(QMainWindow):
         self.statusBar().showMessage(
             f"Selected region: {xmin:.3f}s to {xmax:.3f}s (Duration: {selection_duration:.3f}s)")
 
-        # If we're in the window function tab, also update that plot
+        # If we're in the window function tab, also update that plot, otherwise it's redrawn once shown
         current_tab = self.tabs.currentIndex()
         if current_tab == 2:  # Window Function tab
             # Get current window type and update the windowed plots
             window_type = self.window_combo.currentText()
             self.update_windowed_plot(window_type)
+        else:
+            self._dirty[2] = True
 
     def on_window_function_select(self, xmin, xmax):
         """Handle selection in window function plot"""
@@ -1011,15 +1108,20 @@ class AudioAnalyzerApp(QMainWindow):
         """Handle changes to the frame size slider"""
         self.acoustic_frame_size_ms = value
         self.frame_size_value_label.setText(f"{value} ms")
-        # self.update_acoustic_features()
-        # No automatic update to avoid performance issues with large files
+        self._dirty[1] = True
+        self._acoustic_timer.start(150)
 
     def on_acoustic_hop_size_changed(self, value):
         """Handle changes to the hop size slider"""
         self.acoustic_hop_size_percent = value
         self.hop_size_value_label.setText(f"{value}%")
-        # self.update_acoustic_features()
-        # No automatic update to avoid performance issues with large files
+        self._dirty[1] = True
+        self._acoustic_timer.start(150)
+
+    def refresh_acoustic_features(self):
+        """Recalculate the acoustic features after a slider change, if their tab is still the one shown"""
+        if self.tabs.currentIndex() == 1:
+            self.refresh_tab(1)
 
     # Methods for updating individual feature plots
     def update_volume_plot(self, frame_size, hop_size):
@@ -1037,7 +1139,7 @@ class AudioAnalyzerApp(QMainWindow):
                 min_frame_dur=frame_size/1000
             )
             # Update canvas
-            self.acoustic_canvases['volume'].draw()
+            self.acoustic_canvas.draw_idle()
         except Exception as e:
             QMessageBox.warning(self, "Volume Plot error", f"Error updating volume plot: {str(e)}")
             print(f"Error updating volume plot: {e}")
@@ -1057,7 +1159,7 @@ class AudioAnalyzerApp(QMainWindow):
                 min_frame_dur=frame_size / 1000
             )
             # Update canvas
-            self.acoustic_canvases['fc'].draw()
+            self.acoustic_canvas.draw_idle()
         except Exception as e:
             QMessageBox.warning(self, "Frequency Centroid Plot error", f"Error updating frequency centroid plot: {str(e)}")
             print(f"Error updating frequency centroid plot: {e}")
@@ -1077,7 +1179,7 @@ class AudioAnalyzerApp(QMainWindow):
                 min_frame_dur=frame_size / 1000
             )
             # Update canvas
-            self.acoustic_canvases['bw'].draw()
+            self.acoustic_canvas.draw_idle()
         except Exception as e:
             QMessageBox.warning(self, "Effective bandwidth error", f"Error updating effective bandwidth plot: {str(e)}")
             print(f"Error updating effective bandwidth plot: {e}")
@@ -1097,7 +1199,7 @@ class AudioAnalyzerApp(QMainWindow):
                 min_frame_dur=frame_size / 1000
             )
             # Update canvas
-            self.acoustic_canvases['ber'].draw()
+            self.acoustic_canvas.draw_idle()
         except Exception as e:
             QMessageBox.warning(self, "Band energy ratio error", f"Error updating band energy ratio plot: {str(e)}")
             print(f"Error updating band energy ratio plot: {e}")
@@ -1117,7 +1219,7 @@ class AudioAnalyzerApp(QMainWindow):
                 min_frame_dur=frame_size / 1000
             )
             # Update canvas
-            self.acoustic_canvases['sfm'].draw()
+            self.acoustic_canvas.draw_idle()
         except Exception as e:
             QMessageBox.warning(self, "Spectral flatness measure error", f"Error updating spectral flatness measure plot: {str(e)}")
             print(f"Error updating spectral flatness measure plot: {e}")
@@ -1137,16 +1239,15 @@ class AudioAnalyzerApp(QMainWindow):
                 min_frame_dur=frame_size / 1000
             )
             # Update canvas
-            self.acoustic_canvases['scf'].draw()
+            self.acoustic_canvas.draw_idle()
         except Exception as e:
             QMessageBox.warning(self, "Spectral crest factor error", f"Error updating spectral crest factor plot: {str(e)}")
             print(f"Error updating spectral crest factor plot: {e}")
 
     def handle_tab_changed(self, index):
         """Handle tab change events"""
-        if index == 1 and self.audio_data is not None:  # Tab 2 (Acoustic Features)
-            # Update acoustic features when switching to this tab
-            self.update_acoustic_features()
+        # Redraw the tab that just became visible if anything changed since it was last shown
+        self.refresh_tab(index)
 
 
 
@@ -1154,4 +1255,6 @@ class AudioAnalyzerApp(QMainWindow):
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     ex = AudioAnalyzerApp()
+    # Compile the numba kernels once the window is up, rather than on the first file or click
+    QTimer.singleShot(0, warmup)
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,28 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions import (ESRB, SCF, SFM, _band_slices, compute_features_cached,
+                       compute_stft_cached, effective_bandwidth, frequency_centroid, vol)
+
+
+@pytest.mark.parametrize("sr", [8000, 44100])
+def test_fused_features_match_numpy(sr):
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(sr).astype(np.float32)
+
+    features = compute_features_cached(signal, sr, 0.02, 0.5)
+    spec, freqs, l = compute_stft_cached(signal, sr, 0.02, 0.5)
+    bands = [spec[:, s] for s in _band_slices(sr, spec.shape[1])]
+    vols = vol(spec)
+    expected = ([vols, frequency_centroid(spec, freqs), effective_bandwidth(spec, freqs)]
+                + [ESRB(l, band, vols) for band in bands]
+                + [SFM(band) for band in bands]
+                + [SCF(band) for band in bands])
+
+    for column, reference in enumerate(expected):
+        np.testing.assert_allclose(features[:, column], reference, rtol=1e-4, equal_nan=True)
@@ -1,18 +1,19 @@
 import numpy as np
 import scipy.signal as signal
+import scipy.fft as fft
 
 def acf(data):
-    ACF = signal.fftconvolve(data, data, mode='full')
-    ACF = ACF[len(ACF)//2:]
-    return ACF
+    N = len(data)
+    # the signal is real, so the half spectrum is enough, and any length from 2N-1 up avoids circular wrap-around
+    n_fft = fft.next_fast_len(2 * N - 1, real=True)
+    fft_signal = fft.rfft(data, n_fft, workers=-1)
+    return fft.irfft(fft_signal.real ** 2 + fft_signal.imag ** 2, n_fft, workers=-1)[:N]
 
 def calculate_zcr(data):
-    length = len(data)
-    crosses = 0
-    for i in range(1, length):
-        if data[i - 1] * data[i] < 0:
-            crosses += 1
-    return crosses / (2 * length)
+    # a crossing is wherever the sign bit flips between neighbouring samples
+    sign = np.signbit(data)
+    crosses = np.count_nonzero(sign[:-1] ^ sign[1:])
+    return crosses / (2 * len(data))
 
 
 def amdf(data):
@@ -24,8 +25,7 @@ def amdf(data):
     sum_x2_shifted = np.roll(sum_x2, -1)
 
 
-    fft_signal = np.fft.fft(data, 2 * N)
-    auto_corr = np.fft.ifft(fft_signal * np.conj(fft_signal)).real[:N]
+    auto_corr = acf(data)
 
     amdf = (sum_x2[:N] + sum_x2_shifted[:N] - 2 * auto_corr) / N
 
@@ -62,33 +62,42 @@ def calculate_f0(data, sample_rate):
         spacing = 1
     return sample_rate / spacing
 
+def frame_edges(length, nframes):
+    # same boundaries as np.array_split: the first length % nframes frames get one extra sample.
+    # Signals shorter than nframes get one frame per sample, the empty frames array_split would add hold nothing
+    nframes = min(nframes, length)
+    q, r = divmod(length, nframes)
+    i = np.arange(nframes + 1)
+    return i * q + np.minimum(i, r)
+
 def calculate_max_vol(full_data, nframes=256):
-    frames = np.array_split(full_data, nframes)
-    maxv = -3
-    for frame in frames:
-        vol = np.sqrt(np.mean(frame ** 2))
-        if vol > maxv:
-            maxv = vol
-    return maxv
+    edges = frame_edges(len(full_data), nframes)
+    energy = np.add.reduceat(full_data ** 2, edges[:-1], dtype=np.float64)
+    return np.sqrt((energy / np.diff(edges)).max())
 
 def calculate_silence_ratio_voiced_unvoiced(full_data, nframes = 256):
     ZCR_thresh = 0.03
-    maxv = calculate_max_vol(full_data, nframes)
-    silent = 0
-    frames = np.array_split(full_data, nframes)
-    silent_idxs =[]
-    voiced_idxs = []
-    unvoiced_idxs = []
-    curr_idx = 0
-    for frame in frames:
-        vol = np.sqrt(sum(frame ** 2))
-        if calculate_zcr(frame) < ZCR_thresh and vol < 0.05*maxv:
-            silent += 1
-            silent_idxs.append((curr_idx, curr_idx + len(frame)))
-        elif calculate_zcr(frame) < ZCR_thresh and vol > 0.05*maxv:
-            voiced_idxs.append((curr_idx, curr_idx + len(frame)))
-        else:
-            unvoiced_idxs.append((curr_idx, curr_idx + len(frame)))
-        curr_idx += len(frame)
-    return (silent/nframes), silent_idxs, voiced_idxs, unvoiced_idxs
-
+    edges = frame_edges(len(full_data), nframes)
+    starts, ends = edges[:-1], edges[1:]
+    lengths = ends - starts
+
+    # per-frame sums over the whole signal at once instead of a python loop over the frames
+    vol = np.sqrt(np.add.reduceat(full_data ** 2, starts, dtype=np.float64) / lengths)
+    sign = np.signbit(full_data)
+    flips = np.zeros(len(full_data), dtype=np.intp)
+    flips[:-1] = sign[:-1] ^ sign[1:]
+    # a flip between the last sample of a frame and the first of the next belongs to neither
+    flips[ends - 1] = 0
+    zcr = np.add.reduceat(flips, starts) / (2 * lengths)
+
+    # the same frames and RMS as calculate_max_vol
+    maxv = vol.max()
+    quiet = zcr < ZCR_thresh
+    silent = quiet & (vol < 0.05*maxv)
+    voiced = quiet & (vol > 0.05*maxv)
+    unvoiced = ~(silent | voiced)
+
+    def ranges(mask):
+        return list(zip(starts[mask].tolist(), ends[mask].tolist()))
+
+    return (np.count_nonzero(silent)/len(starts)), ranges(silent), ranges(voiced), ranges(unvoiced)
@@ -1,15 +1,30 @@
 import sys
-import numpy as np
 import wave
+import numpy as np
+from scipy.io import wavfile
 import sounddevice as sd
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QPushButton, QFileDialog,
                              QVBoxLayout, QHBoxLayout, QWidget, QLabel, QSlider,
-                             QTabWidget, QCheckBox, QLineEdit)
+                             QTabWidget, QCheckBox, QLineEdit, QMessageBox)
 import pyqtgraph as pg
 from PyQt6.QtCore import Qt
 from feature_functions import *
 
 
+def read_wav_frames(path):
+    with wave.open(path, 'rb') as wav_file:
+        if wav_file.getsampwidth() != 2:
+            raise ValueError(f"unsupported sample width: {8 * wav_file.getsampwidth()} bits")
+        n_channels = wav_file.getnchannels()
+        sample_rate = wav_file.getframerate()
+        data = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+    # Drop a partial frame at the end so the samples split evenly into channels
+    data = data[:len(data) - len(data) % n_channels]
+    if n_channels > 1:
+        data = data.reshape(-1, n_channels)
+    return sample_rate, data
+
+
 class WAVViewer(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -42,6 +57,9 @@ class WAVViewer(QMainWindow):
         param_layout = QVBoxLayout()
 
         self.plotWidget = pg.PlotWidget()
+        # Draw at most a min/max pair per pixel of what's in view, not every sample of the file
+        self.plotWidget.setDownsampling(auto=True, mode='peak')
+        self.plotWidget.setClipToView(True)
         plot_layout.addWidget(self.plotWidget)
 
         self.infoLabel = QLabel("No file loaded.")
@@ -112,6 +130,7 @@ class WAVViewer(QMainWindow):
         self.silence_regions = []
         self.audio_data = None
         self.sample_rate = None
+        self.params_cache = None  # ((start_index, end_index), parameters) of the last calculated frame
 
         # container = QWidget()
         # container.setLayout(main_layout)
@@ -121,6 +140,9 @@ class WAVViewer(QMainWindow):
         layout = QVBoxLayout()
         self.acfPlot = pg.PlotWidget(title="Autocorrelation Function")
         self.amdfPlot = pg.PlotWidget(title="Average Magnitude Difference Function")
+        for plot in (self.acfPlot, self.amdfPlot):
+            plot.setDownsampling(auto=True, mode='peak')
+            plot.setClipToView(True)
         layout.addWidget(self.acfPlot)
         layout.addWidget(self.amdfPlot)
         self.acfTab.setLayout(layout)
@@ -136,12 +158,14 @@ class WAVViewer(QMainWindow):
         self.update_frame_highlight()
 
     def update_frame_highlight(self):
-        if self.frame_region:
-            self.plotWidget.removeItem(self.frame_region)
-
         start_time = (self.frameStartSlider.value() / 100) * self.audio_duration
         end_time = start_time + (self.frameDurationSlider.value() / 1000)
 
+        # Slider ticks only move the existing region, it is created once per loaded plot
+        if self.frame_region is not None:
+            self.frame_region.setRegion([start_time, end_time])
+            return
+
         self.frame_region = pg.LinearRegionItem([start_time, end_time], brush=(255, 0, 0, 50))
         self.plotWidget.addItem(self.frame_region)
 
@@ -159,11 +183,16 @@ class WAVViewer(QMainWindow):
         if len(frame_data) == 0:
             return
 
-        # Placeholder for actual calculations
-        f0 = calculate_f0(frame_data, self.sample_rate)
-        ste = np.mean(frame_data**2)
-        volume = ste ** 0.5
-        ZCR = calculate_zcr(frame_data)
+        # Same frame as last time - reuse the results instead of redoing the AMDF
+        if self.params_cache is not None and self.params_cache[0] == (start_index, end_index):
+            f0, ste, volume, ZCR = self.params_cache[1]
+        else:
+            # Placeholder for actual calculations
+            f0 = calculate_f0(frame_data, self.sample_rate)
+            ste = np.mean(frame_data**2)
+            volume = ste ** 0.5
+            ZCR = calculate_zcr(frame_data)
+            self.params_cache = ((start_index, end_index), (f0, ste, volume, ZCR))
 
         self.paramFields["Volume"].setText(f"{volume:.6f}")
         self.paramFields["STE"].setText(f"{ste:.6f}")
@@ -187,37 +216,52 @@ class WAVViewer(QMainWindow):
     def load_wav(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Open WAV File", "", "WAV Files (*.wav)")
         if file_path:
-            self.plot_wav(file_path)
+            try:
+                self.plot_wav(file_path)
+            except (ValueError, EOFError, wave.Error) as e:
+                QMessageBox.critical(self, "Error", f"Could not read {file_path}:\n{e}")
 
     def plot_wav(self, file_path):
-        with wave.open(file_path, 'rb') as wav_file:
-            n_channels = wav_file.getnchannels()
-            self.sample_rate = wav_file.getframerate()
-            n_frames = wav_file.getnframes()
-            self.audio_duration = n_frames / self.sample_rate
-            self.audio_data = np.frombuffer(wav_file.readframes(n_frames), \
-                                            dtype=np.int16)
-            self.audio_data = (self.audio_data.astype(np.float32) / np.iinfo(np.int16).max)
-
+        # Memory-mapped, so samples are only read while converting below. Containers numpy can't map
+        # (24-bit) are read normally instead, and files scipy rejects (e.g. a truncated last frame)
+        # through the wave module
+        try:
+            self.sample_rate, raw = wavfile.read(file_path, mmap=True)
+        except ValueError:
+            try:
+                self.sample_rate, raw = wavfile.read(file_path)
+            except ValueError:
+                self.sample_rate, raw = read_wav_frames(file_path)
+        self.audio_duration = len(raw) / self.sample_rate
+        # Single pass from the file's samples to float32, without an intermediate full-size copy
+        if raw.ndim == 2:
+            # Stereo is mixed down to the average of its channels rather than dropping one
+            self.audio_data = np.mean(raw, axis=1, dtype=np.float32)
+        else:
+            self.audio_data = np.empty(len(raw), dtype=np.float32)
+            self.audio_data[:] = raw
+        if np.issubdtype(raw.dtype, np.integer):
+            self.audio_data *= np.float32(1 / np.iinfo(raw.dtype).max)
+        del raw
 
-            if n_channels == 2:
-                self.audio_data = self.audio_data[::2]
-            self.maxv = calculate_max_vol(self.audio_data)
+        self.maxv = calculate_max_vol(self.audio_data)
+        self.params_cache = None
 
-            time_axis = np.linspace(0, self.audio_duration, num=len(self.audio_data))
+        time_axis = np.linspace(0, self.audio_duration, num=len(self.audio_data))
 
-            self.plotWidget.clear()
-            self.plotWidget.plot(time_axis, self.audio_data, pen='b')
+        self.plotWidget.clear()
+        self.frame_region = None  # removed by clear(), update_frame_highlight adds a new one
+        self.plotWidget.plot(time_axis, self.audio_data, pen='b')
 
-            self.infoLabel.setText(
-                f"File: {file_path}\nSample Rate: {self.sample_rate} Hz, Duration: {self.audio_duration:.2f} sec {self.maxv:.2f}")
+        self.infoLabel.setText(
+            f"File: {file_path}\nSample Rate: {self.sample_rate} Hz, Duration: {self.audio_duration:.2f} sec {self.maxv:.2f}")
 
-            self.playButton.setEnabled(True)
-            self.update_frame_highlight()
-            SR, self.silent_idx, self.voiced_idx, self.unvoiced_idx = calculate_silence_ratio_voiced_unvoiced(self.audio_data)
-            self.paramFields["SR"].setText(str(SR))
+        self.playButton.setEnabled(True)
+        self.update_frame_highlight()
+        SR, self.silent_idx, self.voiced_idx, self.unvoiced_idx = calculate_silence_ratio_voiced_unvoiced(self.audio_data)
+        self.paramFields["SR"].setText(str(SR))
 
-            self.plot_acf_amdf()
+        self.plot_acf_amdf()
 
     def plot_acf_amdf(self):
         acf_values = acf(self.audio_data)